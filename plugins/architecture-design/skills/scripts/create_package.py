@@ -6,99 +6,224 @@ Includes: ARCHITECTURE.md, OpenAPI spec, PDF, and diagram images.
 
 import sys
 import os
+import base64
 import json
+import functools
+import hashlib
+import mmap
+import multiprocessing
 import subprocess
 import shutil
+import socket
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import zipfile
 
+# Optional: route zipfile's DEFLATE and CRC32 through the
+# SIMD-accelerated ISA-L implementation when python-isal is installed
+# (several times faster on the text-heavy entries). zipfile resolves
+# zlib.compressobj at call time, so the swap is transparent; crc32 is
+# bound at zipfile import, so patch it there as well.
+try:
+    import zlib
+    from isal import isal_zlib as _isal_zlib
+    zlib.compressobj = _isal_zlib.compressobj
+    zlib.crc32 = _isal_zlib.crc32
+    zipfile.crc32 = _isal_zlib.crc32
+except ImportError:
+    pass
 
-def convert_markdown_to_pdf(md_file: str, output_pdf: str, work_dir: str) -> bool:
-    """Convert markdown to PDF using pandoc if available, else create placeholder."""
-    try:
-        # Try using pandoc
+
+# Content-addressed cache for rendered Mermaid diagrams.
+# Keys include the mmdc version and background flag so a toolchain
+# upgrade or flag change never reuses a stale render.
+MERMAID_CACHE_DIR = Path.home() / '.cache' / 'claude-rock' / 'mermaid'
+
+_mmdc_version = None
+
+
+def get_mmdc_version() -> str:
+    """Return the installed mmdc version string (probed once per process)."""
+    global _mmdc_version
+    if _mmdc_version is None:
         result = subprocess.run(
-            ['pandoc', md_file, '-o', output_pdf, '--pdf-engine=pdflatex'],
+            ['mmdc', '--version'],
             capture_output=True,
             text=True,
             timeout=30
         )
-        if result.returncode == 0:
-            return True
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    
-    # Fallback: Try weasyprint
+        _mmdc_version = result.stdout.strip()
+    return _mmdc_version
+
+
+def mermaid_cache_path(mmd_source: bytes, version: str) -> Path:
+    """Compute the cache file path for a diagram source rendered by `version`."""
+    key = hashlib.sha256(version.encode() + b'|transparent|' + mmd_source).hexdigest()
+    return MERMAID_CACHE_DIR / (key + '.png')
+
+
+def copy_from_cache(cache_file: Path, output_file: str) -> None:
+    """Materialize a cached render at output_file (hardlink, copy fallback)."""
+    if os.path.exists(output_file):
+        os.remove(output_file)
     try:
-        import markdown
-        from weasyprint import HTML, CSS
-        
-        # Read markdown
-        with open(md_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        
-        # Convert to HTML
-        html_content = markdown.markdown(md_content, extensions=['tables', 'fenced_code'])
-        
-        # Add styling
-        styled_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    max-width: 800px;
-                    margin: 40px auto;
-                    padding: 0 20px;
-                }}
-                h1, h2, h3 {{ color: #333; }}
-                h1 {{ border-bottom: 2px solid #333; padding-bottom: 10px; }}
-                h2 {{ border-bottom: 1px solid #666; padding-bottom: 5px; margin-top: 30px; }}
-                code {{
-                    background: #f4f4f4;
-                    padding: 2px 6px;
-                    border-radius: 3px;
-                    font-family: 'Courier New', monospace;
-                }}
-                pre {{
-                    background: #f4f4f4;
-                    padding: 15px;
-                    border-radius: 5px;
-                    overflow-x: auto;
-                }}
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin: 20px 0;
-                }}
-                th, td {{
-                    border: 1px solid #ddd;
-                    padding: 12px;
-                    text-align: left;
-                }}
-                th {{
-                    background-color: #f2f2f2;
-                    font-weight: bold;
-                }}
-            </style>
-        </head>
-        <body>
-            {html_content}
-        </body>
-        </html>
-        """
-        
-        # Convert HTML to PDF
-        HTML(string=styled_html).write_pdf(output_pdf)
-        return True
-        
-    except ImportError:
+        os.link(cache_file, output_file)
+    except OSError:
+        shutil.copyfile(cache_file, output_file)
+
+
+def store_in_cache(output_file: str, cache_file: Path) -> None:
+    """Store a fresh render in the cache (atomic via temp file + rename)."""
+    try:
+        MERMAID_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = str(cache_file) + '.tmp'
+        shutil.copyfile(output_file, tmp_file)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Cache is best-effort; the render itself already succeeded
         pass
-    
-    # Last resort: Create a simple text-based PDF notice
+
+
+# Styling for the weasyprint fallback
+PDF_CSS = """
+body {
+    font-family: Arial, sans-serif;
+    line-height: 1.6;
+    max-width: 800px;
+    margin: 40px auto;
+    padding: 0 20px;
+}
+h1, h2, h3 { color: #333; }
+h1 { border-bottom: 2px solid #333; padding-bottom: 10px; }
+h2 { border-bottom: 1px solid #666; padding-bottom: 5px; margin-top: 30px; }
+code {
+    background: #f4f4f4;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+}
+pre {
+    background: #f4f4f4;
+    padding: 15px;
+    border-radius: 5px;
+    overflow-x: auto;
+}
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 20px 0;
+}
+th, td {
+    border: 1px solid #ddd;
+    padding: 12px;
+    text-align: left;
+}
+th {
+    background-color: #f2f2f2;
+    font-weight: bold;
+}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def pandoc_available() -> bool:
+    """Check once per process whether pandoc is on PATH."""
+    return shutil.which('pandoc') is not None
+
+
+@functools.lru_cache(maxsize=1)
+def pandoc_pdf_engine() -> str:
+    """Pick the pandoc PDF engine, preferring tectonic when installed.
+
+    tectonic keeps an on-disk bundle cache, so repeat conversions skip
+    the format-file and font loading that pdflatex redoes every run.
+    """
+    if shutil.which('tectonic') is not None:
+        return 'tectonic'
+    return 'pdflatex'
+
+
+@functools.lru_cache(maxsize=1)
+def weasyprint_available() -> bool:
+    """Check once per process whether the weasyprint toolchain is importable.
+
+    Uses find_spec so an absent install is detected in microseconds
+    instead of paying the cold import just to catch ImportError.
+    """
+    import importlib.util
+    return (importlib.util.find_spec('markdown') is not None
+            and importlib.util.find_spec('weasyprint') is not None)
+
+
+def _weasyprint_render(md_file: str, output_pdf: str) -> None:
+    """Render markdown to PDF via weasyprint (runs in a worker process)."""
+    import markdown
+    from weasyprint import HTML, CSS
+
+    # Read markdown
+    with open(md_file, 'r', encoding='utf-8') as f:
+        md_content = f.read()
+
+    # Convert to HTML
+    html_content = markdown.markdown(md_content, extensions=['tables', 'fenced_code'])
+
+    styled_html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+    </head>
+    <body>
+        {html_content}
+    </body>
+    </html>
+    """
+
+    # Convert HTML to PDF
+    HTML(string=styled_html).write_pdf(output_pdf, stylesheets=[CSS(string=PDF_CSS)])
+
+
+def convert_markdown_to_pdf(md_file: str, output_pdf: str, work_dir: str):
+    """Convert markdown to PDF using pandoc if available.
+
+    Returns (success, notice): on success the notice is None; on failure
+    it holds the bytes of a generation notice for the package builder to
+    embed directly in the archive.
+    """
+    # Skip conversion when the PDF is already newer than the markdown
+    if os.path.exists(output_pdf) and os.path.getmtime(output_pdf) >= os.path.getmtime(md_file):
+        print(f"✅ PDF is up to date, skipping conversion")
+        return True, None
+
+    if pandoc_available():
+        try:
+            result = subprocess.run(
+                ['pandoc', md_file, '-o', output_pdf, f'--pdf-engine={pandoc_pdf_engine()}'],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if result.returncode == 0:
+                return True, None
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+
+    # Fallback: weasyprint in a worker process so a hung render can be
+    # killed instead of blocking the pipeline indefinitely
+    if weasyprint_available():
+        proc = multiprocessing.Process(target=_weasyprint_render, args=(md_file, output_pdf))
+        proc.start()
+        proc.join(30)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join()
+            print(f"⚠️  weasyprint timed out after 30s")
+        elif proc.exitcode == 0 and os.path.exists(output_pdf):
+            return True, None
+
+    # Last resort: return a simple text notice for the package builder
     notice = f"""PDF Generation Not Available
 
 The required tools (pandoc or weasyprint) are not installed.
@@ -114,116 +239,317 @@ Then run:
    OR
    python {os.path.abspath(__file__)} <work_dir>
 """
-    
-    # Create a simple text file as placeholder
-    with open(output_pdf + '.txt', 'w') as f:
-        f.write(notice)
-    
-    print(f"⚠️  PDF generation tools not available. Created notice file instead.")
-    return False
+
+    print(f"⚠️  PDF generation tools not available. A notice will be packaged instead.")
+    return False, notice.encode()
+
+
+# Companion Node script that keeps one Puppeteer browser alive and
+# renders diagrams on demand over a Unix socket
+MERMAID_SERVER_JS = Path(__file__).resolve().parent / 'mermaid_server.js'
+
+
+def render_mermaid_server(to_render: list):
+    """Render diagrams through the persistent Node rendering server.
+
+    The server boots the browser once per package, so only the first
+    diagram pays the ~2s startup; each subsequent render costs just the
+    draw. Returns the list of output paths, or None when the server
+    cannot be used (no node, no mermaid-cli module, non-Unix platform)
+    so callers fall back to mmdc.
+    """
+    if not MERMAID_SERVER_JS.exists() or not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    tmp_dir = tempfile.mkdtemp(prefix='claude-rock-mermaid-')
+    socket_path = os.path.join(tmp_dir, 'render.sock')
+    proc = None
+    try:
+        proc = subprocess.Popen(
+            ['node', str(MERMAID_SERVER_JS), socket_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        # Wait for the server to create its socket
+        deadline = time.monotonic() + 30
+        while not os.path.exists(socket_path):
+            if proc.poll() is not None or time.monotonic() > deadline:
+                return None
+            time.sleep(0.05)
+
+        rendered_files = []
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.settimeout(30)
+            sock.connect(socket_path)
+            reader = sock.makefile('rb')
+            for i, (mmd_file, output_file, cache_file) in enumerate(to_render):
+                request = {
+                    'id': i,
+                    'source': mmd_file.read_text(encoding='utf-8'),
+                    'background': 'transparent',
+                }
+                sock.sendall(json.dumps(request).encode() + b'\n')
+                response = json.loads(reader.readline())
+                if not response.get('ok'):
+                    return None
+                with open(output_file, 'wb') as f:
+                    f.write(base64.b64decode(response['data']))
+                store_in_cache(output_file, cache_file)
+                print(f"✅ Rendered: {mmd_file.name} → {os.path.basename(output_file)}")
+                rendered_files.append(output_file)
+
+        return rendered_files
+
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def render_mermaid_batch(to_render: list):
+    """Render several diagrams with a single mmdc invocation.
+
+    mmdc accepts a markdown file with fenced mermaid blocks and emits one
+    numbered image per block, so the Node/Puppeteer startup cost is paid
+    once for the whole batch. Returns the list of output paths, or None
+    if the batched invocation failed (callers fall back to per-file).
+    """
+    with tempfile.TemporaryDirectory(prefix='claude-rock-mermaid-') as tmp_dir:
+        bundle_md = os.path.join(tmp_dir, 'bundle.md')
+        with open(bundle_md, 'w', encoding='utf-8') as f:
+            for mmd_file, _output_file, _cache_file in to_render:
+                f.write('```mermaid\n')
+                f.write(mmd_file.read_text(encoding='utf-8').rstrip('\n'))
+                f.write('\n```\n\n')
+
+        out_md = os.path.join(tmp_dir, 'out.md')
+        result = subprocess.run(
+            ['mmdc', '-i', bundle_md, '-o', out_md, '-e', 'png', '-b', 'transparent'],
+            capture_output=True,
+            text=True,
+            timeout=30 * len(to_render)
+        )
+        if result.returncode != 0:
+            return None
+
+        rendered_files = []
+        for i, (mmd_file, output_file, cache_file) in enumerate(to_render, start=1):
+            produced = os.path.join(tmp_dir, f'out-{i}.png')
+            if not os.path.exists(produced):
+                return None
+            shutil.move(produced, output_file)
+            store_in_cache(output_file, cache_file)
+            print(f"✅ Rendered: {mmd_file.name} → {os.path.basename(output_file)}")
+            rendered_files.append(output_file)
+
+        return rendered_files
 
 
 def render_mermaid_diagrams(work_dir: str, diagrams_dir: str) -> list:
     """Render Mermaid diagrams to PNG images using mmdc if available."""
-    
-    # Find all .mmd files in work directory
-    mmd_files = list(Path(work_dir).glob('*.mmd'))
-    
+
+    # Find all .mmd files in work directory (single scandir pass;
+    # pathlib.glob allocates and re-stats per entry)
+    with os.scandir(work_dir) as entries:
+        mmd_files = [Path(e.path) for e in entries if e.name.endswith('.mmd') and e.is_file()]
+
     if not mmd_files:
         print("No .mmd files found to render")
         return []
-    
+
     os.makedirs(diagrams_dir, exist_ok=True)
     rendered_files = []
-    
+
+    try:
+        version = get_mmdc_version()
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        print(f"⚠️  mermaid-cli not available. Skipping diagram rendering.")
+        print(f"   Install with: npm install -g @mermaid-js/mermaid-cli")
+        return []
+
+    # Resolve cache hits first; only misses need a subprocess
+    to_render = []
     for mmd_file in mmd_files:
         output_file = os.path.join(diagrams_dir, mmd_file.stem + '.png')
-        
-        try:
-            # Try using mermaid-cli (mmdc)
-            result = subprocess.run(
-                ['mmdc', '-i', str(mmd_file), '-o', output_file, '-b', 'transparent'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0 and os.path.exists(output_file):
-                rendered_files.append(output_file)
-                print(f"✅ Rendered: {mmd_file.name} → {os.path.basename(output_file)}")
-            else:
-                print(f"⚠️  Could not render: {mmd_file.name}")
-        
-        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
-            print(f"⚠️  mermaid-cli not available. Skipping diagram rendering.")
-            print(f"   Install with: npm install -g @mermaid-js/mermaid-cli")
-            break
-    
+
+        # Skip the render when the PNG is already newer than the source
+        if os.path.exists(output_file) and os.path.getmtime(output_file) >= os.path.getmtime(mmd_file):
+            print(f"✅ Up to date: {mmd_file.name} → {os.path.basename(output_file)}")
+            rendered_files.append(output_file)
+            continue
+
+        cache_file = mermaid_cache_path(mmd_file.read_bytes(), version)
+        if cache_file.exists():
+            copy_from_cache(cache_file, output_file)
+            print(f"✅ Rendered (cached): {mmd_file.name} → {os.path.basename(output_file)}")
+            rendered_files.append(output_file)
+        else:
+            to_render.append((mmd_file, output_file, cache_file))
+
+    if not to_render:
+        return rendered_files
+
+    # Prefer the persistent rendering server: browser startup is paid
+    # once and each diagram after the first costs only the draw
+    server_rendered = render_mermaid_server(to_render)
+    if server_rendered is not None:
+        rendered_files.extend(server_rendered)
+        return rendered_files
+
+    # Batch all misses into one mmdc invocation to amortize startup
+    try:
+        batch_rendered = render_mermaid_batch(to_render)
+    except (OSError, subprocess.TimeoutExpired):
+        batch_rendered = None
+    if batch_rendered is not None:
+        rendered_files.extend(batch_rendered)
+        return rendered_files
+
+    def render_one(job):
+        """Render a single .mmd file; returns the output path or None."""
+        mmd_file, output_file, cache_file = job
+
+        # Try using mermaid-cli (mmdc)
+        result = subprocess.run(
+            ['mmdc', '-i', str(mmd_file), '-o', output_file, '-b', 'transparent'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+
+        if result.returncode == 0 and os.path.exists(output_file):
+            store_in_cache(output_file, cache_file)
+            print(f"✅ Rendered: {mmd_file.name} → {os.path.basename(output_file)}")
+            return output_file
+
+        print(f"⚠️  Could not render: {mmd_file.name}")
+        return None
+
+    # Fallback: render each file in parallel; each render is an independent
+    # subprocess and the GIL is released while waiting on the child process
+    max_workers = min(os.cpu_count() or 1, len(to_render))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(render_one, job): job for job in to_render}
+        for future in as_completed(futures):
+            try:
+                output_file = future.result()
+                if output_file:
+                    rendered_files.append(output_file)
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                print(f"⚠️  mermaid-cli not available. Skipping diagram rendering.")
+                print(f"   Install with: npm install -g @mermaid-js/mermaid-cli")
+                executor.shutdown(cancel_futures=True)
+                break
+
     return rendered_files
 
 
-def create_package_zip(work_dir: str, output_zip: str) -> bool:
-    """Create a ZIP package with all documentation files in proper structure."""
+# Already-compressed formats where DEFLATE wastes CPU for ~0% size gain
+STORED_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg', '.svg', '.zip')
+
+
+def add_zip_entry(zipf: zipfile.ZipFile, file_path, arc_name: str) -> None:
+    """Add a file to the archive, storing already-compressed formats as-is.
+
+    The file is fed through a read-only mmap, so multi-MB artifacts
+    (PDFs, PNGs) are streamed from the page cache instead of being read
+    into a Python bytes object first.
+    """
+    info = zipfile.ZipInfo.from_file(file_path, arc_name)
+    if arc_name.lower().endswith(STORED_EXTENSIONS):
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map empty files
+            zipf.writestr(info, b'')
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            zipf.writestr(info, mm, compresslevel=1)
+
+
+def create_package_zip(work_dir: str, output_zip: str, notice: bytes = None) -> bool:
+    """Create a ZIP package with all documentation files in proper structure.
+
+    When PDF generation failed, the caller passes the notice bytes and
+    they are written straight into the archive without touching disk.
+    """
     
     work_path = Path(work_dir)
-    
+
+    # One directory pass services every file-presence check below;
+    # probing each candidate with .exists() costs a stat apiece
+    with os.scandir(work_path) as entries:
+        present = {e.name for e in entries if e.is_file()}
+
     # Collect files to include
     files_to_include = []
-    
+
     # ARCHITECTURE.md (required)
-    arch_file = work_path / 'ARCHITECTURE.md'
-    if arch_file.exists():
-        files_to_include.append(('ARCHITECTURE.md', arch_file))
+    if 'ARCHITECTURE.md' in present:
+        files_to_include.append(('ARCHITECTURE.md', work_path / 'ARCHITECTURE.md'))
     else:
         print("❌ ARCHITECTURE.md not found!")
         return False
-    
+
     # OpenAPI spec (if exists)
-    openapi_file = work_path / 'openapi.json'
-    if openapi_file.exists():
-        files_to_include.append(('openapi.json', openapi_file))
-    
+    has_openapi = 'openapi.json' in present
+    if has_openapi:
+        files_to_include.append(('openapi.json', work_path / 'openapi.json'))
+
     # PDF (if exists)
-    pdf_file = work_path / 'ARCHITECTURE.pdf'
-    pdf_exists = False
-    if pdf_file.exists():
-        files_to_include.append(('ARCHITECTURE.pdf', pdf_file))
-        pdf_exists = True
-    else:
-        # Check for the txt notice
-        pdf_txt = work_path / 'ARCHITECTURE.pdf.txt'
-        if pdf_txt.exists():
-            files_to_include.append(('PDF_GENERATION_NOTICE.txt', pdf_txt))
-    
+    pdf_exists = 'ARCHITECTURE.pdf' in present
+    if pdf_exists:
+        files_to_include.append(('ARCHITECTURE.pdf', work_path / 'ARCHITECTURE.pdf'))
+
     # Find .mmd source files (should be in work_dir root)
-    mmd_files = sorted(list(work_path.glob('*.mmd')))
-    
-    # Find diagram images (PNG/SVG)
+    mmd_files = sorted(work_path / name for name in present if name.endswith('.mmd'))
+
+    # Find diagram images (PNG/SVG) in one directory pass
     diagrams_dir = work_path / 'diagrams'
     diagram_files = []
     if diagrams_dir.exists():
-        diagram_files = sorted(list(diagrams_dir.glob('*.png')) + list(diagrams_dir.glob('*.svg')))
+        with os.scandir(diagrams_dir) as entries:
+            diagram_files = sorted(
+                Path(e.path) for e in entries
+                if e.name.endswith(('.png', '.svg')) and e.is_file()
+            )
     
     # Create ZIP with proper structure
     try:
-        with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=1, allowZip64=True) as zipf:
             # Add main files at root
             for arc_name, file_path in files_to_include:
-                zipf.write(file_path, arc_name)
+                add_zip_entry(zipf, file_path, arc_name)
                 print(f"📦 Added: {arc_name}")
-            
+
+            # Inject the PDF generation notice directly from memory
+            if notice and not pdf_exists:
+                zipf.writestr('PDF_GENERATION_NOTICE.txt', notice)
+                print(f"📦 Added: PDF_GENERATION_NOTICE.txt")
+
             # Add .mmd source files to diagrams/source/
             if mmd_files:
                 for mmd_file in mmd_files:
                     arc_name = f"diagrams/source/{mmd_file.name}"
-                    zipf.write(mmd_file, arc_name)
+                    add_zip_entry(zipf, mmd_file, arc_name)
                     print(f"📦 Added: {arc_name}")
-            
+
             # Add rendered diagram images to diagrams/
             if diagram_files:
                 for diagram_file in diagram_files:
                     arc_name = f"diagrams/{diagram_file.name}"
-                    zipf.write(diagram_file, arc_name)
+                    add_zip_entry(zipf, diagram_file, arc_name)
                     print(f"📦 Added: {arc_name}")
         
         # Print summary
@@ -232,7 +558,7 @@ def create_package_zip(work_dir: str, output_zip: str) -> bool:
         print(f"   ├── ARCHITECTURE.md")
         if pdf_exists:
             print(f"   ├── ARCHITECTURE.pdf")
-        if openapi_file.exists():
+        if has_openapi:
             print(f"   ├── openapi.json")
         if mmd_files or diagram_files:
             print(f"   └── diagrams/")
@@ -274,25 +600,30 @@ def main():
     print(f"Work directory: {work_dir}")
     print(f"Output ZIP: {output_zip}\n")
     
-    # Step 1: Convert Markdown to PDF
+    # Steps 1 + 2: PDF conversion and diagram rendering touch disjoint
+    # files and spawn disjoint external tools, so run them concurrently;
+    # total wall clock becomes max(pdf, diagrams) instead of their sum
+    pdf_notice = None
     arch_md = os.path.join(work_dir, 'ARCHITECTURE.md')
-    if os.path.exists(arch_md):
-        print("📄 Converting ARCHITECTURE.md to PDF...")
-        pdf_file = os.path.join(work_dir, 'ARCHITECTURE.pdf')
-        convert_markdown_to_pdf(arch_md, pdf_file, work_dir)
-        print()
-    
-    # Step 2: Render Mermaid diagrams
     diagrams_dir = os.path.join(work_dir, 'diagrams')
+    print("📄 Converting ARCHITECTURE.md to PDF...")
     print("🎨 Rendering Mermaid diagrams...")
-    rendered = render_mermaid_diagrams(work_dir, diagrams_dir)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pdf_future = None
+        if os.path.exists(arch_md):
+            pdf_file = os.path.join(work_dir, 'ARCHITECTURE.pdf')
+            pdf_future = executor.submit(convert_markdown_to_pdf, arch_md, pdf_file, work_dir)
+        diagrams_future = executor.submit(render_mermaid_diagrams, work_dir, diagrams_dir)
+        if pdf_future is not None:
+            _, pdf_notice = pdf_future.result()
+        rendered = diagrams_future.result()
     if rendered:
         print(f"✅ Rendered {len(rendered)} diagram(s)")
     print()
     
     # Step 3: Create ZIP package
     print("📦 Creating ZIP package...")
-    success = create_package_zip(work_dir, output_zip)
+    success = create_package_zip(work_dir, output_zip, notice=pdf_notice)
     
     if success:
         # Get file size
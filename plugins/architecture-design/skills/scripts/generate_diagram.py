@@ -5,9 +5,21 @@ Supports simple component and data flow diagrams.
 """
 
 import sys
-import json
+import io
 from typing import List, Dict, Tuple
 
+# Optional: orjson parses JSON several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Block templates for the C4 context diagram, parsed once at import; an
+# f-string in a loop re-runs its formatting bytecode on every iteration
+_ACTOR_TMPL = "[{name}]\n    |\n    v\n"
+_EXT_TMPL = "[{name}] (External)\n"
+_SYS_BOX_TMPL = "{border}\n|{name}|\n{border}\n"
+
 
 def generate_simple_diagram(components: List[str], connections: List[Tuple[str, str]]) -> str:
     """
@@ -18,7 +30,11 @@ def generate_simple_diagram(components: List[str], connections: List[Tuple[str,
         connections: List of (from_component, to_component) tuples
     """
     diagram_lines = []
-    
+
+    # Hash lookups instead of scanning the connection list per component;
+    # both directions go into the set so one membership test suffices
+    conn_set = frozenset(connections) | frozenset((b, a) for a, b in connections)
+
     # Create component boxes
     for i, component in enumerate(components):
         if i == 0:
@@ -26,7 +42,7 @@ def generate_simple_diagram(components: List[str], connections: List[Tuple[str,
         else:
             # Add connection arrow
             prev = components[i-1]
-            if (prev, component) in connections or (component, prev) in connections:
+            if (prev, component) in conn_set:
                 diagram_lines.append("    |")
                 diagram_lines.append("    v")
             else:
@@ -44,17 +60,17 @@ def generate_layered_diagram(layers: Dict[str, List[str]]) -> str:
         layers: Dict of layer_name -> [components]
     """
     diagram_lines = []
-    
+    border = "+" + "-" * 60 + "+"
+
     for layer_name, components in layers.items():
         diagram_lines.append(f"\n{layer_name}:")
-        diagram_lines.append("+" + "-" * 60 + "+")
-        
-        for component in components:
-            # Center the component name
-            padding = (58 - len(component)) // 2
-            diagram_lines.append(f"| {' ' * padding}{component}{' ' * (58 - len(component) - padding)} |")
-        
-        diagram_lines.append("+" + "-" * 60 + "+")
+        diagram_lines.append(border)
+
+        # Center every component in one sweep; extend skips the repeated
+        # bound-method append lookups of a manual loop
+        diagram_lines.extend(f"| {component.center(58)} |" for component in components)
+
+        diagram_lines.append(border)
         diagram_lines.append("        |")
         diagram_lines.append("        v")
     
@@ -72,25 +88,32 @@ def generate_flow_diagram(flow: List[Dict[str, str]]) -> str:
     Args:
         flow: List of dicts with 'from', 'to', 'label' keys
     """
-    diagram_lines = []
+    # Write straight into a string buffer; skips the intermediate line
+    # list and the final join traversal
+    buf = io.StringIO()
+    w = buf.write
     components_seen = set()
-    
+    last_emitted = None
+
     for step in flow:
         from_comp = step['from']
         to_comp = step['to']
         label = step.get('label', '')
-        
-        if from_comp not in components_seen:
-            diagram_lines.append(f"[{from_comp}]")
+
+        # In a linear chain each step starts where the previous one
+        # ended, so comparing against the last emitted component skips
+        # the set lookup in the common case
+        if from_comp != last_emitted and from_comp not in components_seen:
+            w(f"[{from_comp}]\n")
             components_seen.add(from_comp)
-        
+
         # Add arrow with label
-        arrow = f"    |--{label}-->" if label else "    |---->"
-        diagram_lines.append(arrow)
-        diagram_lines.append(f"[{to_comp}]")
+        w(f"    |--{label}-->\n" if label else "    |---->\n")
+        w(f"[{to_comp}]\n")
         components_seen.add(to_comp)
-    
-    return "\n".join(diagram_lines)
+        last_emitted = to_comp
+
+    return buf.getvalue()[:-1] if flow else ""
 
 
 def generate_c4_context_diagram(system: str, actors: List[str], external_systems: List[str]) -> str:
@@ -102,29 +125,27 @@ def generate_c4_context_diagram(system: str, actors: List[str], external_systems
         actors: List of user types/actors
         external_systems: List of external systems
     """
-    diagram_lines = []
-    
-    # Add actors
-    for actor in actors:
-        diagram_lines.append(f"[{actor}]")
-        diagram_lines.append("    |")
-        diagram_lines.append("    v")
-    
+    # Write straight into a string buffer; skips the intermediate line
+    # list and the final join traversal
+    buf = io.StringIO()
+    w = buf.write
+
+    # Add actors, formatted in one pass and written as a single chunk
+    w(''.join(_ACTOR_TMPL.format_map({'name': actor}) for actor in actors))
+
     # Add main system
-    diagram_lines.append("+" + "=" * 40 + "+")
-    diagram_lines.append(f"|{system.center(40)}|")
-    diagram_lines.append("+" + "=" * 40 + "+")
-    
+    border = "+" + "=" * 40 + "+"
+    w(_SYS_BOX_TMPL.format_map({'border': border, 'name': system.center(40)}))
+
     # Add external systems
     if external_systems:
-        diagram_lines.append("    |")
-        diagram_lines.append("    v")
+        w("    |\n    v\n")
         for ext_sys in external_systems:
-            diagram_lines.append(f"[{ext_sys}] (External)")
+            w(_EXT_TMPL.format_map({'name': ext_sys}))
             if ext_sys != external_systems[-1]:
-                diagram_lines.append("    |")
-    
-    return "\n".join(diagram_lines)
+                w("    |\n")
+
+    return buf.getvalue()[:-1]
 
 
 def main():
@@ -142,6 +163,12 @@ def main():
         sys.exit(1)
     
     diagram_type = sys.argv[1].lower()
+
+    if orjson is not None:
+        loads = orjson.loads
+    else:
+        import json
+        loads = json.loads
     
     if diagram_type == "simple":
         if len(sys.argv) < 3:
@@ -149,7 +176,7 @@ def main():
             components = ["User", "Frontend", "Backend", "Database"]
             connections = [("User", "Frontend"), ("Frontend", "Backend"), ("Backend", "Database")]
         else:
-            config = json.loads(sys.argv[2])
+            config = loads(sys.argv[2])
             components = config.get('components', [])
             connections = [tuple(c) for c in config.get('connections', [])]
         
@@ -164,7 +191,7 @@ def main():
                 "Data Layer": ["Database", "Cache"]
             }
         else:
-            layers = json.loads(sys.argv[2])
+            layers = loads(sys.argv[2])
         
         print(generate_layered_diagram(layers))
     
@@ -177,7 +204,7 @@ def main():
                 {"from": "Service", "to": "Database", "label": "query"}
             ]
         else:
-            flow = json.loads(sys.argv[2])
+            flow = loads(sys.argv[2])
         
         print(generate_flow_diagram(flow))
     
@@ -188,7 +215,7 @@ def main():
             actors = ["End User", "Administrator"]
             external_systems = ["Payment Gateway", "Email Service"]
         else:
-            config = json.loads(sys.argv[2])
+            config = loads(sys.argv[2])
             system = config.get('system', 'System')
             actors = config.get('actors', [])
             external_systems = config.get('external_systems', [])
@@ -5,63 +5,89 @@ Creates 5 essential diagrams: C4 Context, Container, Component, Data Flow, and D
 """
 
 import sys
-import json
-from typing import Dict, List, Any
+import re
+from typing import Dict, Iterator, Any
 
+# Optional: orjson parses JSON several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def generate_c4_context(system_info: Dict[str, Any]) -> str:
+# Per-row line templates, formatted once per element; an f-string in a
+# loop re-runs its formatting bytecode on every iteration
+PERSON_LINE = '    Person({id}, "{name}", "{desc}")\n'
+SYSTEM_EXT_LINE = '    System_Ext({id}, "{name}", "{desc}")\n'
+REL_LINE = '    Rel({src}, {dst}, "{desc}")\n'
+REL_BRACKET_PROTO_LINE = '    Rel({src}, {dst}, "{desc} [{proto}]")\n'
+REL_ARG_PROTO_LINE = '    Rel({src}, {dst}, "{desc}", "{proto}")\n'
+CONTAINER_LINE = '        Container({id}, "{name}", "{tech}", "{desc}")\n'
+COMPONENT_LINE = '        Component({id}, "{name}", "{tech}", "{desc}")\n'
+DEP_DB_LINE = '    ContainerDb({id}, "{name}", "{tech}", "{desc}")\n'
+FLOW_NODE_LINE = '        {id}["{name}"]\n'
+FLOW_NODE_TECH_LINE = '        {id}["{name}<br/>({tech})"]\n'
+FLOW_EDGE_LINE = '    {src} -->|"{label}"| {dst}\n'
+DEPLOY_NODE_LINE = '{indent}Deployment_Node({id}, "{name}", "{tech}") {{\n'
+DEPLOY_CONTAINER_LINE = '{indent}Container({id}, "{name}", "{tech}", "{desc}")\n'
+DEPLOY_DB_LINE = '{indent}ContainerDb({id}, "{name}", "{tech}", "{desc}")\n'
+
+# Classifies database containers in one scan, without the per-item
+# .lower() allocations of repeated substring checks
+_DB_RE = re.compile(r'db|database', re.IGNORECASE)
+
+
+def generate_c4_context(system_info: Dict[str, Any]) -> Iterator[str]:
     """Generate C4 Level 1: System Context diagram."""
     system_name = system_info.get('system_name', 'System')
     users = system_info.get('users', [])
     external_systems = system_info.get('external_systems', [])
     
-    diagram = f"""```mermaid
+    yield f"""```mermaid
 C4Context
     title System Context - {system_name}
 """
     
-    # Add users
-    for i, user in enumerate(users):
-        user_id = user.get('id', f'user{i}')
-        user_name = user.get('name', f'User {i}')
-        user_desc = user.get('description', 'System user')
-        diagram += f'    Person({user_id}, "{user_name}", "{user_desc}")\n'
-    
+    # Add users, remembering each derived id for the relationship loop
+    user_ids = [user.get('id', f'user{i}') for i, user in enumerate(users)]
+    yield ''.join(
+        PERSON_LINE.format(id=user_id, name=user.get('name', f'User {i}'),
+                           desc=user.get('description', 'System user'))
+        for i, (user_id, user) in enumerate(zip(user_ids, users)))
+
     # Add main system
     system_desc = system_info.get('description', 'Core system functionality')
-    diagram += f'    System(system, "{system_name}", "{system_desc}")\n'
-    
+    yield f'    System(system, "{system_name}", "{system_desc}")\n'
+
     # Add external systems
-    for i, ext_sys in enumerate(external_systems):
-        ext_id = ext_sys.get('id', f'ext{i}')
-        ext_name = ext_sys.get('name', f'External System {i}')
-        ext_desc = ext_sys.get('description', 'Third-party service')
-        diagram += f'    System_Ext({ext_id}, "{ext_name}", "{ext_desc}")\n'
-    
-    diagram += '\n'
+    ext_ids = [ext_sys.get('id', f'ext{i}') for i, ext_sys in enumerate(external_systems)]
+    yield ''.join(
+        SYSTEM_EXT_LINE.format(id=ext_id, name=ext_sys.get('name', f'External System {i}'),
+                               desc=ext_sys.get('description', 'Third-party service'))
+        for i, (ext_id, ext_sys) in enumerate(zip(ext_ids, external_systems)))
+
+    yield '\n'
+
+    # Add relationships, reusing the ids assigned above (re-defaulting
+    # here used to produce user{len(users)}/ext{len(external_systems)}
+    # ids that never matched the declarations)
+    yield ''.join(
+        REL_LINE.format(src=user_id, dst='system', desc=user.get('relationship', 'uses'))
+        for user_id, user in zip(user_ids, users))
+
+    yield ''.join(
+        REL_LINE.format(src='system', dst=ext_id, desc=ext_sys.get('relationship', 'integrates with'))
+        for ext_id, ext_sys in zip(ext_ids, external_systems))
     
-    # Add relationships
-    for user in users:
-        user_id = user.get('id', f'user{len(users)}')
-        rel = user.get('relationship', 'uses')
-        diagram += f'    Rel({user_id}, system, "{rel}")\n'
-    
-    for ext_sys in external_systems:
-        ext_id = ext_sys.get('id', f'ext{len(external_systems)}')
-        rel = ext_sys.get('relationship', 'integrates with')
-        diagram += f'    Rel(system, {ext_id}, "{rel}")\n'
-    
-    diagram += '```'
-    return diagram
+    yield '```'
 
 
-def generate_c4_container(system_info: Dict[str, Any]) -> str:
+def generate_c4_container(system_info: Dict[str, Any]) -> Iterator[str]:
     """Generate C4 Level 2: Container diagram."""
     system_name = system_info.get('system_name', 'System')
     containers = system_info.get('containers', [])
     external_systems = system_info.get('external_systems', [])
     
-    diagram = f"""```mermaid
+    yield f"""```mermaid
 C4Container
     title Container Diagram - {system_name}
     
@@ -71,46 +97,42 @@ C4Container
 """
     
     # Add containers
-    for container in containers:
-        cont_id = container.get('id', 'container')
-        cont_name = container.get('name', 'Container')
-        cont_tech = container.get('technology', 'Technology')
-        cont_desc = container.get('description', 'Container description')
-        diagram += f'        Container({cont_id}, "{cont_name}", "{cont_tech}", "{cont_desc}")\n'
+    yield ''.join(
+        CONTAINER_LINE.format(id=c.get('id', 'container'), name=c.get('name', 'Container'),
+                              tech=c.get('technology', 'Technology'),
+                              desc=c.get('description', 'Container description'))
+        for c in containers)
     
-    diagram += '    }\n\n'
+    yield '    }\n\n'
     
-    # Add external systems (simplified)
-    for ext_sys in external_systems[:2]:  # Limit to 2 for clarity
-        ext_id = ext_sys.get('id', 'ext')
-        ext_name = ext_sys.get('name', 'External System')
-        ext_desc = ext_sys.get('description', 'External service')
-        diagram += f'    System_Ext({ext_id}, "{ext_name}", "{ext_desc}")\n'
+    # Add external systems (simplified; limit to 2 for clarity)
+    yield ''.join(
+        SYSTEM_EXT_LINE.format(id=e.get('id', 'ext'), name=e.get('name', 'External System'),
+                               desc=e.get('description', 'External service'))
+        for e in external_systems[:2])
     
-    diagram += '\n'
+    yield '\n'
     
     # Add relationships
     relationships = system_info.get('container_relationships', [])
-    for rel in relationships:
-        from_id = rel.get('from', '')
-        to_id = rel.get('to', '')
-        desc = rel.get('description', 'interacts')
-        protocol = rel.get('protocol', '')
-        if protocol:
-            diagram += f'    Rel({from_id}, {to_id}, "{desc} [{protocol}]")\n'
-        else:
-            diagram += f'    Rel({from_id}, {to_id}, "{desc}")\n'
-    
-    diagram += '```'
-    return diagram
+    yield ''.join(
+        REL_BRACKET_PROTO_LINE.format(src=r.get('from', ''), dst=r.get('to', ''),
+                                      desc=r.get('description', 'interacts'),
+                                      proto=r.get('protocol', ''))
+        if r.get('protocol', '') else
+        REL_LINE.format(src=r.get('from', ''), dst=r.get('to', ''),
+                        desc=r.get('description', 'interacts'))
+        for r in relationships)
+    
+    yield '```'
 
 
-def generate_c4_component(system_info: Dict[str, Any]) -> str:
+def generate_c4_component(system_info: Dict[str, Any]) -> Iterator[str]:
     """Generate C4 Level 3: Component diagram for main container."""
     container_name = system_info.get('main_container_name', 'API Service')
     components = system_info.get('components', [])
     
-    diagram = f"""```mermaid
+    yield f"""```mermaid
 C4Component
     title Component Diagram - {container_name}
     
@@ -118,110 +140,97 @@ C4Component
 """
     
     # Add components
-    for comp in components:
-        comp_id = comp.get('id', 'component')
-        comp_name = comp.get('name', 'Component')
-        comp_tech = comp.get('technology', 'Technology')
-        comp_desc = comp.get('description', 'Component description')
-        diagram += f'        Component({comp_id}, "{comp_name}", "{comp_tech}", "{comp_desc}")\n'
+    yield ''.join(
+        COMPONENT_LINE.format(id=c.get('id', 'component'), name=c.get('name', 'Component'),
+                              tech=c.get('technology', 'Technology'),
+                              desc=c.get('description', 'Component description'))
+        for c in components)
     
-    diagram += '    }\n\n'
+    yield '    }\n\n'
     
     # Add external dependencies
     ext_deps = system_info.get('component_dependencies', [])
-    for dep in ext_deps:
-        dep_id = dep.get('id', 'dep')
-        dep_name = dep.get('name', 'Dependency')
-        dep_type = dep.get('type', 'Database')
-        dep_tech = dep.get('technology', 'Technology')
-        
-        if 'db' in dep_type.lower() or 'database' in dep_type.lower():
-            diagram += f'    ContainerDb({dep_id}, "{dep_name}", "{dep_tech}", "{dep_type}")\n'
-        else:
-            diagram += f'    System_Ext({dep_id}, "{dep_name}", "{dep_type}")\n'
+    yield ''.join(
+        DEP_DB_LINE.format(id=d.get('id', 'dep'), name=d.get('name', 'Dependency'),
+                           tech=d.get('technology', 'Technology'), desc=d.get('type', 'Database'))
+        if _DB_RE.search(d.get('type', 'Database')) else
+        SYSTEM_EXT_LINE.format(id=d.get('id', 'dep'), name=d.get('name', 'Dependency'),
+                               desc=d.get('type', 'Database'))
+        for d in ext_deps)
     
-    diagram += '\n'
+    yield '\n'
     
     # Add component relationships
     comp_rels = system_info.get('component_relationships', [])
-    for rel in comp_rels:
-        from_id = rel.get('from', '')
-        to_id = rel.get('to', '')
-        desc = rel.get('description', 'uses')
-        diagram += f'    Rel({from_id}, {to_id}, "{desc}")\n'
-    
-    diagram += '```'
-    return diagram
+    yield ''.join(
+        REL_LINE.format(src=r.get('from', ''), dst=r.get('to', ''),
+                        desc=r.get('description', 'uses'))
+        for r in comp_rels)
+    
+    yield '```'
 
 
-def generate_data_flow(system_info: Dict[str, Any]) -> str:
+def generate_data_flow(system_info: Dict[str, Any]) -> Iterator[str]:
     """Generate Data Flow Diagram."""
-    diagram = """```mermaid
+    yield """```mermaid
 flowchart LR
     subgraph sources["📥 Data Sources"]
 """
     
     # Data sources
     data_sources = system_info.get('data_sources', [])
-    for source in data_sources:
-        source_id = source.get('id', 'source')
-        source_name = source.get('name', 'Source')
-        diagram += f'        {source_id}["{source_name}"]\n'
+    yield ''.join(
+        FLOW_NODE_LINE.format(id=s.get('id', 'source'), name=s.get('name', 'Source'))
+        for s in data_sources)
     
-    diagram += '    end\n\n'
-    diagram += '    subgraph processes["⚙️ Data Processing"]\n'
+    yield '    end\n\n'
+    yield '    subgraph processes["⚙️ Data Processing"]\n'
     
     # Processing steps
     processes = system_info.get('data_processes', [])
-    for process in processes:
-        proc_id = process.get('id', 'process')
-        proc_name = process.get('name', 'Process')
-        diagram += f'        {proc_id}["{proc_name}"]\n'
+    yield ''.join(
+        FLOW_NODE_LINE.format(id=p.get('id', 'process'), name=p.get('name', 'Process'))
+        for p in processes)
     
-    diagram += '    end\n\n'
-    diagram += '    subgraph storage["💾 Data Storage"]\n'
+    yield '    end\n\n'
+    yield '    subgraph storage["💾 Data Storage"]\n'
     
     # Storage
     storages = system_info.get('data_storage', [])
-    for store in storages:
-        store_id = store.get('id', 'store')
-        store_name = store.get('name', 'Storage')
-        store_tech = store.get('technology', '')
-        if store_tech:
-            diagram += f'        {store_id}["{store_name}<br/>({store_tech})"]\n'
-        else:
-            diagram += f'        {store_id}["{store_name}"]\n'
+    yield ''.join(
+        FLOW_NODE_TECH_LINE.format(id=s.get('id', 'store'), name=s.get('name', 'Storage'),
+                                   tech=s.get('technology', ''))
+        if s.get('technology', '') else
+        FLOW_NODE_LINE.format(id=s.get('id', 'store'), name=s.get('name', 'Storage'))
+        for s in storages)
     
-    diagram += '    end\n\n'
-    diagram += '    subgraph outputs["📤 Data Outputs"]\n'
+    yield '    end\n\n'
+    yield '    subgraph outputs["📤 Data Outputs"]\n'
     
     # Outputs
     outputs = system_info.get('data_outputs', [])
-    for output in outputs:
-        out_id = output.get('id', 'output')
-        out_name = output.get('name', 'Output')
-        diagram += f'        {out_id}["{out_name}"]\n'
+    yield ''.join(
+        FLOW_NODE_LINE.format(id=o.get('id', 'output'), name=o.get('name', 'Output'))
+        for o in outputs)
     
-    diagram += '    end\n\n'
+    yield '    end\n\n'
     
     # Add flows
     flows = system_info.get('data_flows', [])
-    for flow in flows:
-        from_id = flow.get('from', '')
-        to_id = flow.get('to', '')
-        label = flow.get('label', 'data')
-        diagram += f'    {from_id} -->|"{label}"| {to_id}\n'
-    
-    diagram += '```'
-    return diagram
+    yield ''.join(
+        FLOW_EDGE_LINE.format(src=f.get('from', ''), label=f.get('label', 'data'),
+                              dst=f.get('to', ''))
+        for f in flows)
+    
+    yield '```'
 
 
-def generate_deployment(system_info: Dict[str, Any]) -> str:
+def generate_deployment(system_info: Dict[str, Any]) -> Iterator[str]:
     """Generate C4 Deployment diagram."""
     system_name = system_info.get('system_name', 'System')
     cloud_provider = system_info.get('cloud_provider', 'Cloud Provider')
     
-    diagram = f"""```mermaid
+    yield f"""```mermaid
 C4Deployment
     title Deployment Diagram - {system_name}
     
@@ -231,65 +240,66 @@ C4Deployment
     deployment_nodes = system_info.get('deployment_nodes', [])
     
     for node in deployment_nodes:
-        node_id = node.get('id', 'node')
-        node_name = node.get('name', 'Node')
-        node_tech = node.get('technology', 'Technology')
-        containers = node.get('containers', [])
-        nested_nodes = node.get('nested_nodes', [])
+        g = node.get
+        node_id = g('id', 'node')
+        node_name = g('name', 'Node')
+        node_tech = g('technology', 'Technology')
+        containers = g('containers', [])
+        nested_nodes = g('nested_nodes', [])
         
-        diagram += f'    Deployment_Node({node_id}, "{node_name}", "{node_tech}") {{\n'
+        yield DEPLOY_NODE_LINE.format(indent='    ', id=node_id, name=node_name, tech=node_tech)
         
         # Add nested nodes if any
         for nested in nested_nodes:
-            nested_id = nested.get('id', 'nested')
-            nested_name = nested.get('name', 'Node')
-            nested_tech = nested.get('technology', 'Tech')
-            nested_containers = nested.get('containers', [])
+            ng = nested.get
+            nested_id = ng('id', 'nested')
+            nested_name = ng('name', 'Node')
+            nested_tech = ng('technology', 'Tech')
+            nested_containers = ng('containers', [])
             
-            diagram += f'        Deployment_Node({nested_id}, "{nested_name}", "{nested_tech}") {{\n'
+            yield DEPLOY_NODE_LINE.format(indent='        ', id=nested_id, name=nested_name, tech=nested_tech)
             
             for cont in nested_containers:
-                cont_id = cont.get('id', 'cont')
-                cont_name = cont.get('name', 'Container')
-                cont_tech = cont.get('technology', 'Tech')
-                cont_desc = cont.get('description', 'Description')
+                cg = cont.get
+                cont_id = cg('id', 'cont')
+                cont_name = cg('name', 'Container')
+                cont_tech = cg('technology', 'Tech')
+                cont_desc = cg('description', 'Description')
                 
-                if 'db' in cont_name.lower() or 'database' in cont_name.lower():
-                    diagram += f'            ContainerDb({cont_id}, "{cont_name}", "{cont_tech}", "{cont_desc}")\n'
+                if _DB_RE.search(cont_name):
+                    yield DEPLOY_DB_LINE.format(indent='            ', id=cont_id, name=cont_name, tech=cont_tech, desc=cont_desc)
                 else:
-                    diagram += f'            Container({cont_id}, "{cont_name}", "{cont_tech}", "{cont_desc}")\n'
+                    yield DEPLOY_CONTAINER_LINE.format(indent='            ', id=cont_id, name=cont_name, tech=cont_tech, desc=cont_desc)
             
-            diagram += '        }\n'
+            yield '        }\n'
         
         # Add direct containers
         for cont in containers:
-            cont_id = cont.get('id', 'cont')
-            cont_name = cont.get('name', 'Container')
-            cont_tech = cont.get('technology', 'Tech')
-            cont_desc = cont.get('description', 'Description')
+            cg = cont.get
+            cont_id = cg('id', 'cont')
+            cont_name = cg('name', 'Container')
+            cont_tech = cg('technology', 'Tech')
+            cont_desc = cg('description', 'Description')
             
-            if 'db' in cont_name.lower() or 'database' in cont_name.lower():
-                diagram += f'        ContainerDb({cont_id}, "{cont_name}", "{cont_tech}", "{cont_desc}")\n'
+            if _DB_RE.search(cont_name):
+                yield DEPLOY_DB_LINE.format(indent='        ', id=cont_id, name=cont_name, tech=cont_tech, desc=cont_desc)
             else:
-                diagram += f'        Container({cont_id}, "{cont_name}", "{cont_tech}", "{cont_desc}")\n'
+                yield CONTAINER_LINE.format(id=cont_id, name=cont_name, tech=cont_tech, desc=cont_desc)
         
-        diagram += '    }\n\n'
+        yield '    }\n\n'
     
     # Add relationships
     deployment_rels = system_info.get('deployment_relationships', [])
-    for rel in deployment_rels:
-        from_id = rel.get('from', '')
-        to_id = rel.get('to', '')
-        desc = rel.get('description', 'connects')
-        protocol = rel.get('protocol', '')
-        
-        if protocol:
-            diagram += f'    Rel({from_id}, {to_id}, "{desc}", "{protocol}")\n'
-        else:
-            diagram += f'    Rel({from_id}, {to_id}, "{desc}")\n'
-    
-    diagram += '```'
-    return diagram
+    yield ''.join(
+        REL_ARG_PROTO_LINE.format(src=r.get('from', ''), dst=r.get('to', ''),
+                                  desc=r.get('description', 'connects'),
+                                  proto=r.get('protocol', ''))
+        if r.get('protocol', '') else
+        REL_LINE.format(src=r.get('from', ''), dst=r.get('to', ''),
+                        desc=r.get('description', 'connects'))
+        for r in deployment_rels)
+    
+    yield '```'
 
 
 def main():
@@ -299,46 +309,51 @@ def main():
         print("\nConfig JSON should contain system architecture information")
         sys.exit(1)
     
-    # Load configuration
+    # Load configuration (ValueError covers both stdlib and orjson
+    # decode errors); json is only imported on the fallback path so the
+    # common short-lived CLI invocation skips the module load
     try:
-        config = json.loads(sys.argv[1])
-    except json.JSONDecodeError as e:
+        if orjson is not None:
+            config = orjson.loads(sys.argv[1])
+        else:
+            import json
+            config = json.loads(sys.argv[1])
+    except ValueError as e:
         print(f"Error parsing JSON: {e}")
         sys.exit(1)
     
-    # Generate all 5 diagrams
-    diagrams = {
-        'c4_context': generate_c4_context(config),
-        'c4_container': generate_c4_container(config),
-        'c4_component': generate_c4_component(config),
-        'data_flow': generate_data_flow(config),
-        'deployment': generate_deployment(config)
-    }
-    
-    # Output diagrams
-    print("### Diagram 1: System Context (C4 Level 1)\n")
-    print("**Description**: Shows the system in context with external users and systems\n")
-    print(diagrams['c4_context'])
-    print("\n---\n")
-    
-    print("### Diagram 2: Container Diagram (C4 Level 2)\n")
-    print("**Description**: Shows the main technical components and their relationships\n")
-    print(diagrams['c4_container'])
-    print("\n---\n")
-    
-    print("### Diagram 3: Component Diagram (C4 Level 3)\n")
-    print("**Description**: Shows internal components of the main container\n")
-    print(diagrams['c4_component'])
-    print("\n---\n")
-    
-    print("### Diagram 4: Data Flow Diagram\n")
-    print("**Description**: Shows how data moves through the system\n")
-    print(diagrams['data_flow'])
-    print("\n---\n")
-    
-    print("### Diagram 5: Deployment Diagram\n")
-    print("**Description**: Shows infrastructure and deployment topology\n")
-    print(diagrams['deployment'])
+    # Stream each diagram to stdout as it is generated; no diagram is
+    # ever materialized as one large string
+    sections = [
+        ("### Diagram 1: System Context (C4 Level 1)\n\n"
+         "**Description**: Shows the system in context with external users and systems\n\n",
+         generate_c4_context),
+        ("### Diagram 2: Container Diagram (C4 Level 2)\n\n"
+         "**Description**: Shows the main technical components and their relationships\n\n",
+         generate_c4_container),
+        ("### Diagram 3: Component Diagram (C4 Level 3)\n\n"
+         "**Description**: Shows internal components of the main container\n\n",
+         generate_c4_component),
+        ("### Diagram 4: Data Flow Diagram\n\n"
+         "**Description**: Shows how data moves through the system\n\n",
+         generate_data_flow),
+        ("### Diagram 5: Deployment Diagram\n\n"
+         "**Description**: Shows infrastructure and deployment topology\n\n",
+         generate_deployment),
+    ]
+
+    # Accumulate the chunks and hand the whole document to the kernel in
+    # one write, instead of one syscall (plus stdout lock) per chunk
+    out = bytearray()
+    for i, (heading, generate) in enumerate(sections):
+        if i:
+            out += b'\n\n---\n\n'
+        out += heading.encode()
+        for chunk in generate(config):
+            out += chunk.encode()
+    out += b'\n'
+    sys.stdout.buffer.write(out)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
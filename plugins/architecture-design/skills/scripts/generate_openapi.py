@@ -5,8 +5,116 @@ Creates a comprehensive API specification for the designed endpoints.
 """
 
 import sys
-import json
-from typing import Dict, List, Any
+import copy
+import functools
+from typing import Dict, Any
+
+# Optional: orjson parses and serializes JSON several times faster
+# than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared sub-documents, built once at import and inserted by reference;
+# the generated spec is only ever serialized, never mutated, so every
+# endpoint can point at the same dicts
+_ERROR_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "error": {
+            "type": "string",
+            "description": "Error message"
+        },
+        "code": {
+            "type": "string",
+            "description": "Error code"
+        }
+    },
+    "required": ["error"]
+}
+
+_UNAUTHORIZED_RESPONSE = {
+    "description": "Authentication information is missing or invalid",
+    "content": {
+        "application/json": {
+            "schema": {
+                "$ref": "#/components/schemas/Error"
+            }
+        }
+    }
+}
+
+_NOT_FOUND_RESPONSE = {
+    "description": "The specified resource was not found",
+    "content": {
+        "application/json": {
+            "schema": {
+                "$ref": "#/components/schemas/Error"
+            }
+        }
+    }
+}
+
+_DEFAULT_OK = {
+    "description": "Successful operation",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object"
+            }
+        }
+    }
+}
+
+_DEFAULT_RESPONSES = {
+    "200": _DEFAULT_OK,
+    "401": {"$ref": "#/components/responses/UnauthorizedError"},
+    "404": {"$ref": "#/components/responses/NotFoundError"}
+}
+
+
+def _build_security(auth_type: str) -> Dict[str, Dict[str, str]]:
+    """Return the security schemes for an authentication type."""
+    if auth_type == 'bearer' or auth_type == 'jwt':
+        return {
+            "bearerAuth": {
+                "type": "http",
+                "scheme": "bearer",
+                "bearerFormat": "JWT"
+            }
+        }
+    if auth_type == 'apikey':
+        return {
+            "apiKey": {
+                "type": "apiKey",
+                "in": "header",
+                "name": "X-API-Key"
+            }
+        }
+    return {}
+
+
+def _build_operation(path: str, method: str, endpoint: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the operation object for one endpoint."""
+    operation: Dict[str, Any] = {
+        "summary": endpoint.get('summary', ''),
+        "description": endpoint.get('description', ''),
+        "operationId": endpoint.get('operation_id', method + path.replace('/', '_')),
+        "tags": endpoint.get('tags', ['default']),
+        # Default responses are a shared constant, inserted by reference
+        "responses": endpoint.get('responses') or _DEFAULT_RESPONSES
+    }
+
+    parameters = endpoint.get('parameters', [])
+    if parameters:
+        operation['parameters'] = parameters
+
+    request_body = endpoint.get('request_body', None)
+    if request_body:
+        operation['requestBody'] = request_body
+
+    return operation
 
 
 def generate_openapi_spec(api_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -45,59 +153,15 @@ def generate_openapi_spec(api_info: Dict[str, Any]) -> Dict[str, Any]:
     
     # Add security schemes
     auth_type = api_info.get('authentication', 'bearer')
-    if auth_type == 'bearer' or auth_type == 'jwt':
-        spec['components']['securitySchemes']['bearerAuth'] = {
-            "type": "http",
-            "scheme": "bearer",
-            "bearerFormat": "JWT"
-        }
-        spec['security'] = [{"bearerAuth": []}]
-    elif auth_type == 'apikey':
-        spec['components']['securitySchemes']['apiKey'] = {
-            "type": "apiKey",
-            "in": "header",
-            "name": "X-API-Key"
-        }
-        spec['security'] = [{"apiKey": []}]
+    schemes = _build_security(auth_type)
+    if schemes:
+        spec['components']['securitySchemes'].update(schemes)
+        spec['security'] = [{name: [] for name in schemes}]
     
-    # Add common schemas
-    spec['components']['schemas']['Error'] = {
-        "type": "object",
-        "properties": {
-            "error": {
-                "type": "string",
-                "description": "Error message"
-            },
-            "code": {
-                "type": "string",
-                "description": "Error code"
-            }
-        },
-        "required": ["error"]
-    }
-    
-    # Add common responses
-    spec['components']['responses']['UnauthorizedError'] = {
-        "description": "Authentication information is missing or invalid",
-        "content": {
-            "application/json": {
-                "schema": {
-                    "$ref": "#/components/schemas/Error"
-                }
-            }
-        }
-    }
-    
-    spec['components']['responses']['NotFoundError'] = {
-        "description": "The specified resource was not found",
-        "content": {
-            "application/json": {
-                "schema": {
-                    "$ref": "#/components/schemas/Error"
-                }
-            }
-        }
-    }
+    # Add common schemas and responses (shared constants, by reference)
+    spec['components']['schemas']['Error'] = _ERROR_SCHEMA
+    spec['components']['responses']['UnauthorizedError'] = _UNAUTHORIZED_RESPONSE
+    spec['components']['responses']['NotFoundError'] = _NOT_FOUND_RESPONSE
     
     # Add tags
     tags = api_info.get('tags', [])
@@ -112,288 +176,302 @@ def generate_openapi_spec(api_info: Dict[str, Any]) -> Dict[str, Any]:
     for schema_name, schema_def in schemas.items():
         spec['components']['schemas'][schema_name] = schema_def
     
-    # Add endpoints
+    # Add endpoints; resolve path/method once per endpoint and group
+    # operations with a single setdefault lookup
+    paths = spec['paths']
     endpoints = api_info.get('endpoints', [])
-    for endpoint in endpoints:
-        path = endpoint.get('path', '/')
-        method = endpoint.get('method', 'get').lower()
-        
-        if path not in spec['paths']:
-            spec['paths'][path] = {}
-        
-        operation = {
-            "summary": endpoint.get('summary', ''),
-            "description": endpoint.get('description', ''),
-            "operationId": endpoint.get('operation_id', method + path.replace('/', '_')),
-            "tags": endpoint.get('tags', ['default']),
-            "responses": {}
-        }
-        
-        # Add parameters
-        parameters = endpoint.get('parameters', [])
-        if parameters:
-            operation['parameters'] = parameters
-        
-        # Add request body
-        request_body = endpoint.get('request_body', None)
-        if request_body:
-            operation['requestBody'] = request_body
-        
-        # Add responses
-        responses = endpoint.get('responses', {})
-        if responses:
-            operation['responses'] = responses
-        else:
-            # Default responses
-            operation['responses'] = {
-                "200": {
-                    "description": "Successful operation",
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object"
-                            }
-                        }
-                    }
-                },
-                "401": {
-                    "$ref": "#/components/responses/UnauthorizedError"
-                },
-                "404": {
-                    "$ref": "#/components/responses/NotFoundError"
-                }
-            }
-        
-        spec['paths'][path][method] = operation
-    
+    endpoint_rows = [(e.get('path', '/'), e.get('method', 'get').lower(), e) for e in endpoints]
+    for path, method, endpoint in endpoint_rows:
+        paths.setdefault(path, {})[method] = _build_operation(path, method, endpoint)
+
     return spec
 
 
-def generate_default_crud_api(resource_name: str) -> Dict[str, Any]:
-    """Generate a default CRUD API specification for a resource."""
-    
-    resource_lower = resource_name.lower()
-    resource_title = resource_name.title()
-    
-    api_info = {
-        "system_name": f"{resource_title} Management",
-        "version": "1.0.0",
-        "description": f"API for managing {resource_lower} resources",
-        "base_url": "https://api.example.com/v1",
-        "authentication": "bearer",
-        "tags": [
-            {
-                "name": resource_lower,
-                "description": f"{resource_title} operations"
-            }
-        ],
-        "schemas": {
-            resource_title: {
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "string",
-                        "format": "uuid",
-                        "description": f"{resource_title} ID"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": f"{resource_title} name"
-                    },
-                    "createdAt": {
-                        "type": "string",
-                        "format": "date-time",
-                        "description": "Creation timestamp"
-                    },
-                    "updatedAt": {
-                        "type": "string",
-                        "format": "date-time",
-                        "description": "Last update timestamp"
-                    }
-                },
-                "required": ["id", "name"]
-            },
-            f"{resource_title}Input": {
+# Default CRUD api_info, stored as one JSON document with %(RL)s/%(RT)s
+# markers for the resource name. Two C-level string replacements plus
+# a single JSON parse replace the construction of ~30 nested dict
+# literals per call.
+_CRUD_API_TEMPLATE = """{
+  "system_name": "%(RT)s Management",
+  "version": "1.0.0",
+  "description": "API for managing %(RL)s resources",
+  "base_url": "https://api.example.com/v1",
+  "authentication": "bearer",
+  "tags": [
+    {
+      "name": "%(RL)s",
+      "description": "%(RT)s operations"
+    }
+  ],
+  "schemas": {
+    "%(RT)s": {
+      "type": "object",
+      "properties": {
+        "id": {
+          "type": "string",
+          "format": "uuid",
+          "description": "%(RT)s ID"
+        },
+        "name": {
+          "type": "string",
+          "description": "%(RT)s name"
+        },
+        "createdAt": {
+          "type": "string",
+          "format": "date-time",
+          "description": "Creation timestamp"
+        },
+        "updatedAt": {
+          "type": "string",
+          "format": "date-time",
+          "description": "Last update timestamp"
+        }
+      },
+      "required": [
+        "id",
+        "name"
+      ]
+    },
+    "%(RT)sInput": {
+      "type": "object",
+      "properties": {
+        "name": {
+          "type": "string",
+          "description": "%(RT)s name"
+        }
+      },
+      "required": [
+        "name"
+      ]
+    }
+  },
+  "endpoints": [
+    {
+      "path": "/%(RL)ss",
+      "method": "get",
+      "summary": "List all %(RL)ss",
+      "description": "Retrieve a list of %(RL)ss with pagination",
+      "operation_id": "list%(RT)ss",
+      "tags": [
+        "%(RL)s"
+      ],
+      "parameters": [
+        {
+          "name": "page",
+          "in": "query",
+          "description": "Page number",
+          "schema": {
+            "type": "integer",
+            "default": 1
+          }
+        },
+        {
+          "name": "limit",
+          "in": "query",
+          "description": "Items per page",
+          "schema": {
+            "type": "integer",
+            "default": 20
+          }
+        }
+      ],
+      "responses": {
+        "200": {
+          "description": "Successful operation",
+          "content": {
+            "application/json": {
+              "schema": {
                 "type": "object",
                 "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": f"{resource_title} name"
-                    }
-                },
-                "required": ["name"]
-            }
-        },
-        "endpoints": [
-            {
-                "path": f"/{resource_lower}s",
-                "method": "get",
-                "summary": f"List all {resource_lower}s",
-                "description": f"Retrieve a list of {resource_lower}s with pagination",
-                "operation_id": f"list{resource_title}s",
-                "tags": [resource_lower],
-                "parameters": [
-                    {
-                        "name": "page",
-                        "in": "query",
-                        "description": "Page number",
-                        "schema": {"type": "integer", "default": 1}
-                    },
-                    {
-                        "name": "limit",
-                        "in": "query",
-                        "description": "Items per page",
-                        "schema": {"type": "integer", "default": 20}
-                    }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Successful operation",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "data": {
-                                            "type": "array",
-                                            "items": {
-                                                "$ref": f"#/components/schemas/{resource_title}"
-                                            }
-                                        },
-                                        "total": {"type": "integer"},
-                                        "page": {"type": "integer"},
-                                        "limit": {"type": "integer"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "path": f"/{resource_lower}s",
-                "method": "post",
-                "summary": f"Create a new {resource_lower}",
-                "description": f"Create a new {resource_lower} resource",
-                "operation_id": f"create{resource_title}",
-                "tags": [resource_lower],
-                "request_body": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "$ref": f"#/components/schemas/{resource_title}Input"
-                            }
-                        }
-                    }
-                },
-                "responses": {
-                    "201": {
-                        "description": "Created successfully",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "$ref": f"#/components/schemas/{resource_title}"
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "path": f"/{resource_lower}s/{{id}}",
-                "method": "get",
-                "summary": f"Get a {resource_lower} by ID",
-                "description": f"Retrieve a specific {resource_lower} by its ID",
-                "operation_id": f"get{resource_title}",
-                "tags": [resource_lower],
-                "parameters": [
-                    {
-                        "name": "id",
-                        "in": "path",
-                        "required": True,
-                        "description": f"{resource_title} ID",
-                        "schema": {"type": "string", "format": "uuid"}
-                    }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Successful operation",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "$ref": f"#/components/schemas/{resource_title}"
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "path": f"/{resource_lower}s/{{id}}",
-                "method": "put",
-                "summary": f"Update a {resource_lower}",
-                "description": f"Update an existing {resource_lower} resource",
-                "operation_id": f"update{resource_title}",
-                "tags": [resource_lower],
-                "parameters": [
-                    {
-                        "name": "id",
-                        "in": "path",
-                        "required": True,
-                        "description": f"{resource_title} ID",
-                        "schema": {"type": "string", "format": "uuid"}
-                    }
-                ],
-                "request_body": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "$ref": f"#/components/schemas/{resource_title}Input"
-                            }
-                        }
-                    }
-                },
-                "responses": {
-                    "200": {
-                        "description": "Updated successfully",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "$ref": f"#/components/schemas/{resource_title}"
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "path": f"/{resource_lower}s/{{id}}",
-                "method": "delete",
-                "summary": f"Delete a {resource_lower}",
-                "description": f"Delete a {resource_lower} resource",
-                "operation_id": f"delete{resource_title}",
-                "tags": [resource_lower],
-                "parameters": [
-                    {
-                        "name": "id",
-                        "in": "path",
-                        "required": True,
-                        "description": f"{resource_title} ID",
-                        "schema": {"type": "string", "format": "uuid"}
-                    }
-                ],
-                "responses": {
-                    "204": {
-                        "description": "Deleted successfully"
+                  "data": {
+                    "type": "array",
+                    "items": {
+                      "$ref": "#/components/schemas/%(RT)s"
                     }
+                  },
+                  "total": {
+                    "type": "integer"
+                  },
+                  "page": {
+                    "type": "integer"
+                  },
+                  "limit": {
+                    "type": "integer"
+                  }
                 }
+              }
             }
-        ]
+          }
+        }
+      }
+    },
+    {
+      "path": "/%(RL)ss",
+      "method": "post",
+      "summary": "Create a new %(RL)s",
+      "description": "Create a new %(RL)s resource",
+      "operation_id": "create%(RT)s",
+      "tags": [
+        "%(RL)s"
+      ],
+      "request_body": {
+        "required": true,
+        "content": {
+          "application/json": {
+            "schema": {
+              "$ref": "#/components/schemas/%(RT)sInput"
+            }
+          }
+        }
+      },
+      "responses": {
+        "201": {
+          "description": "Created successfully",
+          "content": {
+            "application/json": {
+              "schema": {
+                "$ref": "#/components/schemas/%(RT)s"
+              }
+            }
+          }
+        }
+      }
+    },
+    {
+      "path": "/%(RL)ss/{id}",
+      "method": "get",
+      "summary": "Get a %(RL)s by ID",
+      "description": "Retrieve a specific %(RL)s by its ID",
+      "operation_id": "get%(RT)s",
+      "tags": [
+        "%(RL)s"
+      ],
+      "parameters": [
+        {
+          "name": "id",
+          "in": "path",
+          "required": true,
+          "description": "%(RT)s ID",
+          "schema": {
+            "type": "string",
+            "format": "uuid"
+          }
+        }
+      ],
+      "responses": {
+        "200": {
+          "description": "Successful operation",
+          "content": {
+            "application/json": {
+              "schema": {
+                "$ref": "#/components/schemas/%(RT)s"
+              }
+            }
+          }
+        }
+      }
+    },
+    {
+      "path": "/%(RL)ss/{id}",
+      "method": "put",
+      "summary": "Update a %(RL)s",
+      "description": "Update an existing %(RL)s resource",
+      "operation_id": "update%(RT)s",
+      "tags": [
+        "%(RL)s"
+      ],
+      "parameters": [
+        {
+          "name": "id",
+          "in": "path",
+          "required": true,
+          "description": "%(RT)s ID",
+          "schema": {
+            "type": "string",
+            "format": "uuid"
+          }
+        }
+      ],
+      "request_body": {
+        "required": true,
+        "content": {
+          "application/json": {
+            "schema": {
+              "$ref": "#/components/schemas/%(RT)sInput"
+            }
+          }
+        }
+      },
+      "responses": {
+        "200": {
+          "description": "Updated successfully",
+          "content": {
+            "application/json": {
+              "schema": {
+                "$ref": "#/components/schemas/%(RT)s"
+              }
+            }
+          }
+        }
+      }
+    },
+    {
+      "path": "/%(RL)ss/{id}",
+      "method": "delete",
+      "summary": "Delete a %(RL)s",
+      "description": "Delete a %(RL)s resource",
+      "operation_id": "delete%(RT)s",
+      "tags": [
+        "%(RL)s"
+      ],
+      "parameters": [
+        {
+          "name": "id",
+          "in": "path",
+          "required": true,
+          "description": "%(RT)s ID",
+          "schema": {
+            "type": "string",
+            "format": "uuid"
+          }
+        }
+      ],
+      "responses": {
+        "204": {
+          "description": "Deleted successfully"
+        }
+      }
     }
-    
-    return generate_openapi_spec(api_info)
+  ]
+}"""
+
+
+@functools.lru_cache(maxsize=None)
+def _build_crud_api_info(resource_name: str) -> Dict[str, Any]:
+    """Build the CRUD api_info dict for a resource (cached per name)."""
+    import json
+    # Both derived names are computed once and substituted in a single
+    # scan of the template, with no intermediate copy. They are spliced
+    # into JSON string literals, so JSON-escape them first (json.dumps
+    # and the [1:-1] slice drops the surrounding quotes) — a resource
+    # name containing '"', '\\' or a newline must not break the parse.
+    text = _CRUD_API_TEMPLATE % {
+        'RL': json.dumps(resource_name.lower())[1:-1],
+        'RT': json.dumps(resource_name.title())[1:-1],
+    }
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def generate_default_crud_api(resource_name: str) -> Dict[str, Any]:
+    """Generate a default CRUD API specification for a resource."""
+    # Deep-copy the cached api_info so the cache entry cannot be
+    # corrupted through the returned spec. Note the spec still aliases
+    # the shared component constants (Error schema, default responses)
+    # that generate_openapi_spec inserts by reference — treat those
+    # nested dicts as read-only.
+    return generate_openapi_spec(copy.deepcopy(_build_crud_api_info(resource_name)))
 
 
 def main():
@@ -406,17 +484,29 @@ def main():
         sys.exit(1)
     
     input_data = sys.argv[1]
-    
-    # Try to parse as JSON first
+
+    # json is only needed when orjson is unavailable; importing it
+    # lazily keeps it off the startup path of the common case
+    if orjson is None:
+        import json
+
+    # Try to parse as JSON first (ValueError covers both stdlib and
+    # orjson decode errors)
     try:
-        config = json.loads(input_data)
+        if orjson is not None:
+            config = orjson.loads(input_data)
+        else:
+            config = json.loads(input_data)
         spec = generate_openapi_spec(config)
-    except json.JSONDecodeError:
+    except ValueError:
         # Treat as resource name for default CRUD API
         spec = generate_default_crud_api(input_data)
-    
+
     # Output OpenAPI spec
-    print(json.dumps(spec, indent=2))
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(spec, option=orjson.OPT_INDENT_2) + b'\n')
+    else:
+        print(json.dumps(spec, indent=2))
 
 
 if __name__ == "__main__":
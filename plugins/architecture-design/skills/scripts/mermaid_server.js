@@ -0,0 +1,71 @@
+#!/usr/bin/env node
+// Persistent Mermaid rendering server.
+//
+// Boots Puppeteer once and renders diagrams sent over a Unix socket, so
+// callers avoid paying the Node + headless-Chromium startup per diagram.
+// Protocol: newline-delimited JSON requests {id, source, background};
+// responses {id, ok, data} where data holds a base64-encoded PNG.
+//
+// Usage: node mermaid_server.js <socket-path>
+
+const net = require('net');
+
+async function main() {
+  const socketPath = process.argv[2];
+  if (!socketPath) {
+    console.error('Usage: node mermaid_server.js <socket-path>');
+    process.exit(2);
+  }
+
+  const { renderMermaid } = await import('@mermaid-js/mermaid-cli');
+  const puppeteer = await import('puppeteer');
+  const browser = await puppeteer.launch({ args: ['--no-sandbox'] });
+
+  const server = net.createServer((conn) => {
+    let buffered = '';
+    conn.on('data', async (chunk) => {
+      buffered += chunk.toString('utf8');
+      let newline;
+      while ((newline = buffered.indexOf('\n')) >= 0) {
+        const line = buffered.slice(0, newline);
+        buffered = buffered.slice(newline + 1);
+        if (!line.trim()) continue;
+        let request;
+        try {
+          request = JSON.parse(line);
+          const { data } = await renderMermaid(browser, request.source, 'png', {
+            backgroundColor: request.background || 'transparent',
+          });
+          conn.write(JSON.stringify({
+            id: request.id,
+            ok: true,
+            data: Buffer.from(data).toString('base64'),
+          }) + '\n');
+        } catch (err) {
+          conn.write(JSON.stringify({
+            id: request && request.id,
+            ok: false,
+            error: String(err),
+          }) + '\n');
+        }
+      }
+    });
+  });
+
+  server.listen(socketPath);
+
+  const shutdown = async () => {
+    try {
+      await browser.close();
+    } finally {
+      process.exit(0);
+    }
+  };
+  process.on('SIGTERM', shutdown);
+  process.on('SIGINT', shutdown);
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
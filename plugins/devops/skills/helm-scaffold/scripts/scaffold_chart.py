@@ -5,15 +5,117 @@ Generates production-ready Helm charts with best practices
 """
 
 import os
-import shutil
 import argparse
+import functools
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
-def replace_placeholder(content: str, chart_name: str) -> str:
-    """Replace CHARTNAME placeholder with actual chart name"""
-    return content.replace("CHARTNAME", chart_name)
+# Cache of fully-rendered templates keyed on (template bytes, chart name),
+# so repeated scaffolds of the same chart (CI loops) skip the substitution
+TEMPLATE_CACHE_DIR = Path.home() / '.cache' / 'claude-rock' / 'helm-tpl'
+
+# Resolved once at import; create_chart_structure may be called in a
+# loop when scaffolding charts for many services
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "assets" / "templates"
+
+# Workload type templates
+WORKLOAD_TEMPLATES = {
+    "deployment": "deployment/deployment.yaml",
+    "statefulset": "statefulset/statefulset.yaml",
+    "job": "job/job.yaml",
+    "cronjob": "cronjob/cronjob.yaml",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def chart_job_specs(
+    workload_type: str,
+    include_ingress: bool,
+    include_hpa: bool,
+    include_configmap: bool,
+):
+    """Copy jobs for a flag combination: (template, chart-relative dst, needs substitution).
+
+    Cached per combination so repeated scaffolds skip rebuilding the table.
+    """
+    specs = [
+        ("Chart.yaml", "Chart.yaml", True),
+        ("values.yaml", "values.yaml", False),
+        (".helmignore", ".helmignore", False),
+        ("_helpers.tpl", "templates/_helpers.tpl", True),
+        ("NOTES.txt", "templates/NOTES.txt", True),
+        (WORKLOAD_TEMPLATES[workload_type], f"templates/{workload_type}.yaml", True),
+    ]
+
+    # Service (not for jobs)
+    if workload_type in ("deployment", "statefulset"):
+        specs.append(("service/service.yaml", "templates/service.yaml", True))
+
+    # ServiceAccount
+    specs.append(("rbac/serviceaccount.yaml", "templates/serviceaccount.yaml", True))
+
+    # Optional resources
+    if include_ingress:
+        specs.append(("ingress/ingress.yaml", "templates/ingress.yaml", True))
+
+    if include_hpa and workload_type == "deployment":
+        specs.append(("hpa/hpa.yaml", "templates/hpa.yaml", True))
+
+    if include_configmap:
+        specs.append(("configmap/configmap.yaml", "templates/configmap.yaml", True))
+
+    return tuple(specs)
+
+
+def render_template(data: bytes, name_bytes: bytes) -> bytes:
+    """Substitute CHARTNAME into data, reusing a cached render when present."""
+    key = hashlib.sha256(data + b'\0' + name_bytes).hexdigest()
+    cache_file = TEMPLATE_CACHE_DIR / key
+    try:
+        return cache_file.read_bytes()
+    except OSError:
+        pass
+
+    rendered = data.replace(b"CHARTNAME", name_bytes)
+
+    # Populate the cache best-effort (atomic via temp file + rename)
+    try:
+        TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=TEMPLATE_CACHE_DIR)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(rendered)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass
+
+    return rendered
+
+
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """Copy src to dst inside the kernel via copy_file_range.
+
+    Avoids pulling the file contents through userspace for templates that
+    need no placeholder substitution. Returns False when the syscall is
+    unavailable (non-Linux, cross-filesystem) so callers can fall back to
+    a plain read/write.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        return True
+    except OSError:
+        return False
 
 
 def create_chart_structure(
@@ -35,10 +137,6 @@ def create_chart_structure(
         include_hpa: Whether to include HorizontalPodAutoscaler
         include_configmap: Whether to include ConfigMap
     """
-    # Get templates directory
-    script_dir = Path(__file__).parent.parent
-    templates_dir = script_dir / "assets" / "templates"
-    
     # Create chart directory
     chart_dir = Path(output_dir) / chart_name
     chart_dir.mkdir(parents=True, exist_ok=True)
@@ -50,109 +148,34 @@ def create_chart_structure(
     print(f"📦 Creating Helm chart: {chart_name}")
     print(f"📂 Output directory: {chart_dir}")
     
-    # Copy Chart.yaml
-    chart_yaml_src = templates_dir / "Chart.yaml"
-    chart_yaml_dst = chart_dir / "Chart.yaml"
-    with open(chart_yaml_src, 'r') as f:
-        content = replace_placeholder(f.read(), chart_name)
-    with open(chart_yaml_dst, 'w') as f:
-        f.write(content)
-    print("✅ Created Chart.yaml")
-    
-    # Copy values.yaml
-    values_yaml_src = templates_dir / "values.yaml"
-    values_yaml_dst = chart_dir / "values.yaml"
-    shutil.copy2(values_yaml_src, values_yaml_dst)
-    print("✅ Created values.yaml")
-    
-    # Copy .helmignore
-    helmignore_src = templates_dir / ".helmignore"
-    helmignore_dst = chart_dir / ".helmignore"
-    shutil.copy2(helmignore_src, helmignore_dst)
-    print("✅ Created .helmignore")
-    
-    # Copy _helpers.tpl
-    helpers_src = templates_dir / "_helpers.tpl"
-    helpers_dst = templates_output_dir / "_helpers.tpl"
-    with open(helpers_src, 'r') as f:
-        content = replace_placeholder(f.read(), chart_name)
-    with open(helpers_dst, 'w') as f:
-        f.write(content)
-    print("✅ Created templates/_helpers.tpl")
-    
-    # Copy NOTES.txt
-    notes_src = templates_dir / "NOTES.txt"
-    notes_dst = templates_output_dir / "NOTES.txt"
-    with open(notes_src, 'r') as f:
-        content = replace_placeholder(f.read(), chart_name)
-    with open(notes_dst, 'w') as f:
-        f.write(content)
-    print("✅ Created templates/NOTES.txt")
-    
-    # Copy workload type template
-    workload_templates = {
-        "deployment": "deployment/deployment.yaml",
-        "statefulset": "statefulset/statefulset.yaml",
-        "job": "job/job.yaml",
-        "cronjob": "cronjob/cronjob.yaml",
-    }
-    
-    workload_src = templates_dir / workload_templates[workload_type]
-    workload_dst = templates_output_dir / f"{workload_type}.yaml"
-    with open(workload_src, 'r') as f:
-        content = replace_placeholder(f.read(), chart_name)
-    with open(workload_dst, 'w') as f:
-        f.write(content)
-    print(f"✅ Created templates/{workload_type}.yaml")
-    
-    # Copy Service (not for jobs)
-    if workload_type in ["deployment", "statefulset"]:
-        service_src = templates_dir / "service" / "service.yaml"
-        service_dst = templates_output_dir / "service.yaml"
-        with open(service_src, 'r') as f:
-            content = replace_placeholder(f.read(), chart_name)
-        with open(service_dst, 'w') as f:
-            f.write(content)
-        print("✅ Created templates/service.yaml")
-    
-    # Copy ServiceAccount
-    sa_src = templates_dir / "rbac" / "serviceaccount.yaml"
-    sa_dst = templates_output_dir / "serviceaccount.yaml"
-    with open(sa_src, 'r') as f:
-        content = replace_placeholder(f.read(), chart_name)
-    with open(sa_dst, 'w') as f:
-        f.write(content)
-    print("✅ Created templates/serviceaccount.yaml")
-    
-    # Optionally copy Ingress
-    if include_ingress:
-        ingress_src = templates_dir / "ingress" / "ingress.yaml"
-        ingress_dst = templates_output_dir / "ingress.yaml"
-        with open(ingress_src, 'r') as f:
-            content = replace_placeholder(f.read(), chart_name)
-        with open(ingress_dst, 'w') as f:
-            f.write(content)
-        print("✅ Created templates/ingress.yaml")
-    
-    # Optionally copy HPA (only for deployment)
-    if include_hpa and workload_type == "deployment":
-        hpa_src = templates_dir / "hpa" / "hpa.yaml"
-        hpa_dst = templates_output_dir / "hpa.yaml"
-        with open(hpa_src, 'r') as f:
-            content = replace_placeholder(f.read(), chart_name)
-        with open(hpa_dst, 'w') as f:
-            f.write(content)
-        print("✅ Created templates/hpa.yaml")
-    
-    # Optionally copy ConfigMap
-    if include_configmap:
-        cm_src = templates_dir / "configmap" / "configmap.yaml"
-        cm_dst = templates_output_dir / "configmap.yaml"
-        with open(cm_src, 'r') as f:
-            content = replace_placeholder(f.read(), chart_name)
-        with open(cm_dst, 'w') as f:
-            f.write(content)
-        print("✅ Created templates/configmap.yaml")
+    # Materialize the cached job specs against this chart directory
+    jobs = [
+        (TEMPLATES_DIR / src, chart_dir / dst, needs_sub)
+        for src, dst, needs_sub in chart_job_specs(
+            workload_type, include_ingress, include_hpa, include_configmap
+        )
+    ]
+
+    # bytes.replace skips the decode/encode round-trip of reading
+    # templates as text
+    name_bytes = chart_name.encode()
+
+    def apply_job(job):
+        src, dst, needs_sub = job
+        if not needs_sub and _copy_file_range(src, dst):
+            return dst
+        data = src.read_bytes()
+        if needs_sub:
+            data = render_template(data, name_bytes)
+        dst.write_bytes(data)
+        return dst
+
+    # The copies are tiny independent I/O operations (the GIL is released
+    # during the read/write syscalls), so run them through a thread pool;
+    # map preserves job order so the output messages stay stable
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+        for dst in executor.map(apply_job, jobs):
+            print(f"✅ Created {dst.relative_to(chart_dir)}")
     
     print(f"\n🎉 Chart '{chart_name}' created successfully at {chart_dir}")
     print(f"\nNext steps:")
@@ -162,7 +185,7 @@ def create_chart_structure(
     print(f"4. Run: helm install {chart_name} .")
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate production-ready Helm charts",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -217,9 +240,18 @@ Examples:
         action="store_true",
         help="Include ConfigMap resource"
     )
-    
-    args = parser.parse_args()
-    
+
+    return parser
+
+
+# Built once at import so callers invoking main() in a loop do not
+# rebuild the parser per call
+PARSER = build_parser()
+
+
+def main():
+    args = PARSER.parse_args()
+
     create_chart_structure(
         chart_name=args.chart_name,
         output_dir=args.output,